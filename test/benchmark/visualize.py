@@ -5,33 +5,58 @@ Reads the latest JSON result files and produces a self-contained HTML report.
 Usage: python3 visualize.py [results_dir]
 """
 
-import json, os, sys, re, glob
+import gzip, html, json, os, sys, re, glob
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 RESULTS_DIR = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).parent / "results"
 
 
+def _mtime(entry):
+    """Return a directory entry's mtime, or None if it can't be stat'ed."""
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return None
+
+
 def latest(prefix):
-    """Return the most-recently-modified JSON file matching a prefix."""
-    files = sorted(RESULTS_DIR.glob(f"{prefix}_*.json"), key=os.path.getmtime)
-    return files[-1] if files else None
+    """Return (path, mtime) of the most-recently-modified JSON file matching a prefix."""
+    try:
+        it = os.scandir(RESULTS_DIR)
+    except FileNotFoundError:
+        return None, 0.0
+    with it:
+        mtimes = ((_mtime(e), e.path) for e in it
+                  if e.name.startswith(prefix + "_") and e.name.endswith(".json"))
+        best = max((m for m in mtimes if m[0] is not None), default=None)
+    return (Path(best[1]), best[0]) if best else (None, 0.0)
 
 
 def load(path):
     if not path:
         return []
     try:
-        return json.loads(path.read_text())
+        return _loads(path.read_bytes())
     except Exception:
         return []
 
 
-def find(records, test_name):
+def index(records):
+    """Map test name -> record; sized tests are also keyed by (test, message_size_bytes)."""
+    idx = {}
     for r in records:
-        if r.get("test") == test_name:
-            return r
-    return {}
+        t = r.get("test")
+        idx.setdefault(t, r)
+        if "message_size_bytes" in r:
+            idx.setdefault((t, r["message_size_bytes"]), r)
+    return idx
 
 
 def fmt(n, digits=0):
@@ -48,101 +73,54 @@ def fmt(n, digits=0):
     return f"{n:.{digits}f}"
 
 
-def v(record, key, default=0):
-    """Safely extract a numeric value from a result record."""
-    try:
-        return float(record.get(key, default) or default)
-    except (TypeError, ValueError):
-        return default
-
-
-# ── load results ─────────────────────────────────────────────────────────────
-sf  = latest("server")
-cf  = latest("cache")
-pf  = latest("proxy")
-wf  = latest("websocket")
-
-server  = load(sf)
-cache   = load(cf)
-proxy   = load(pf)
-ws      = load(wf)
-
-# Pick the latest timestamp for the title
-ts_raw = (sf or cf or pf or wf)
-ts_str = datetime.fromtimestamp(os.path.getmtime(ts_raw)).strftime("%Y-%m-%d %H:%M") if ts_raw else "unknown"
-
-# ── server metrics ────────────────────────────────────────────────────────────
-s_conn  = find(server, "server_connection_rate")
-s_burst = find(server, "server_burst_connections")
-s_tp64  = next((r for r in server if r.get("test") == "server_single_client_throughput"
-                and r.get("message_size_bytes") == 64), {})
-s_tp1k  = next((r for r in server if r.get("test") == "server_single_client_throughput"
-                and r.get("message_size_bytes") == 1024), {})
-s_conc  = find(server, "server_concurrent_clients")
-
-sv_conn_rate   = v(s_conn,  "connections_per_sec")
-sv_burst_rate  = v(s_burst, "connections_per_sec")
-sv_conn_lat    = float(s_conn.get("avg_latency_ms", 0) or 0)
-sv_tp64_msg    = v(s_tp64,  "messages_per_sec")
-sv_tp64_mb     = v(s_tp64,  "throughput_mb_sec")
-sv_tp1k_msg    = v(s_tp1k,  "messages_per_sec")
-sv_tp1k_mb     = v(s_tp1k,  "throughput_mb_sec")
-sv_conc_msg    = v(s_conc,  "messages_per_sec")
-sv_max_conn    = v(s_burst, "max_concurrent")
-
-# ── cache metrics ─────────────────────────────────────────────────────────────
-c_set   = find(cache, "cache_set_throughput")
-c_get   = find(cache, "cache_get_throughput")
-c_mix   = find(cache, "cache_mixed_workload")
-c_conc  = find(cache, "cache_concurrent_access")
-c_pers  = find(cache, "cache_persistence")
-
-cv_set  = v(c_set,  "ops_per_sec")
-cv_get  = v(c_get,  "ops_per_sec")
-cv_mix  = v(c_mix,  "ops_per_sec")
-cv_conc = v(c_conc, "ops_per_sec")
-cv_flush= v(c_pers, "flush_time_ms")
-cv_load = v(c_pers, "load_time_ms")
-
-# ── proxy metrics ─────────────────────────────────────────────────────────────
-p_http1 = find(proxy, "proxy_http_single_backend")
-p_httplb= find(proxy, "proxy_http_load_balancing")
-p_tcp   = find(proxy, "proxy_tcp_throughput")
-p_conc  = find(proxy, "proxy_concurrent_connections")
-p_over  = find(proxy, "proxy_overhead")
-p_name  = find(proxy, "proxy_runtime_name_backend")
-
-pv_http1  = v(p_http1, "requests_per_sec")
-pv_httplb = v(p_httplb,"requests_per_sec")
-pv_tcp    = v(p_tcp,   "messages_per_sec")
-pv_tcp_mb = v(p_tcp,   "throughput_mb_sec")
-pv_conc   = v(p_conc,  "messages_per_sec")
-pv_overhead= v(p_over, "overhead_percent")
-pv_name   = v(p_name,  "messages_per_sec")
-
-# ── websocket metrics ─────────────────────────────────────────────────────────
-w_hs    = find(ws, "ws_handshake_throughput")
-w_coex  = find(ws, "ws_tcp_coexistence")
-w_conc  = find(ws, "ws_concurrent")
-
-wv_hs   = v(w_hs,   "ops_per_sec")
-wv_coex = v(w_coex, "ops_per_sec")
-wv_conc = v(w_conc, "ops_per_sec")
-
-
-def kilo(n):
-    return round(n / 1000, 1)
-
-
-HTML = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Socketley Benchmark Results</title>
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-<style>
-  :root {{
+def floats(records, spec):
+    """Extract numeric fields from indexed records; spec maps name -> (test key, field)."""
+    out = {}
+    for name, (test, field) in spec.items():
+        r = records.get(test) or {}
+        try:
+            out[name] = float(r.get(field) or 0)
+        except (TypeError, ValueError):
+            out[name] = 0.0
+    return out
+
+
+def bar_svg(labels, values, colors, horizontal=True, unit=""):
+    """Render a small bar chart as inline SVG (viewBox 400x200)."""
+    vmax = max(values, default=0) or 1
+    n = max(len(values), 1)
+    out = ['<svg viewBox="0 0 400 200" role="img">']
+    if horizontal:
+        row = 200 / n
+        bar_h = min(row * 0.6, 40)
+        out.append('<line class="axis" x1="150" y1="0" x2="150" y2="200"/>')
+        for i, (lbl, val, col) in enumerate(zip(labels, values, colors)):
+            y = i * row + (row - bar_h) / 2
+            w = val / vmax * 190
+            out.append(
+                f'<text x="142" y="{y + bar_h / 2:.1f}" text-anchor="end" dominant-baseline="middle">{html.escape(lbl)}</text>'
+                f'<rect x="150" y="{y:.1f}" width="{w:.1f}" height="{bar_h:.1f}" rx="5" fill="{col}">'
+                f'<title>{html.escape(lbl)}: {val:,} {html.escape(unit)}</title></rect>'
+                f'<text class="val" x="{150 + w + 6:.1f}" y="{y + bar_h / 2:.1f}" dominant-baseline="middle">{val:,}</text>')
+    else:
+        col_w = 400 / n
+        bar_w = min(col_w * 0.6, 80)
+        out.append('<line class="axis" x1="0" y1="170" x2="400" y2="170"/>')
+        for i, (lbl, val, col) in enumerate(zip(labels, values, colors)):
+            x = i * col_w + (col_w - bar_w) / 2
+            h = val / vmax * 145
+            cx = i * col_w + col_w / 2
+            out.append(
+                f'<rect x="{x:.1f}" y="{170 - h:.1f}" width="{bar_w:.1f}" height="{h:.1f}" rx="5" fill="{col}">'
+                f'<title>{html.escape(lbl)}: {val:,} {html.escape(unit)}</title></rect>'
+                f'<text class="val" x="{cx:.1f}" y="{170 - h - 6:.1f}" text-anchor="middle">{val:,}</text>'
+                f'<text x="{cx:.1f}" y="188" text-anchor="middle">{html.escape(lbl)}</text>')
+    out.append('</svg>')
+    return "".join(out)
+
+
+# ── static template assets ────────────────────────────────────────────────────
+_CSS = """  :root {
     --bg:      #0d1117;
     --panel:   #161b22;
     --border:  #30363d;
@@ -154,134 +132,279 @@ HTML = f"""<!DOCTYPE html>
     --purple:  #bc8cff;
     --red:     #f85149;
     --teal:    #39d353;
-  }}
-  * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-  body {{
+  }
+  * { box-sizing: border-box; margin: 0; padding: 0; }
+  body {
     background: var(--bg);
     color: var(--text);
     font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, monospace;
     font-size: 14px;
     line-height: 1.6;
-  }}
-  header {{
+  }
+  header {
     background: linear-gradient(135deg, #0d1117 0%, #161b22 100%);
     border-bottom: 1px solid var(--border);
     padding: 32px 40px 24px;
-  }}
-  header h1 {{
+  }
+  header h1 {
     font-size: 28px;
     font-weight: 700;
     color: var(--text);
     letter-spacing: -0.5px;
-  }}
-  header h1 span {{ color: var(--accent); }}
-  header p {{ color: var(--muted); margin-top: 6px; font-size: 13px; }}
+  }
+  header h1 span { color: var(--accent); }
+  header p { color: var(--muted); margin-top: 6px; font-size: 13px; }
 
-  .badges {{
+  .badges {
     display: flex; gap: 10px; margin-top: 14px; flex-wrap: wrap;
-  }}
-  .badge {{
+  }
+  .badge {
     background: var(--panel);
     border: 1px solid var(--border);
     border-radius: 20px;
     padding: 3px 12px;
     font-size: 12px;
     color: var(--muted);
-  }}
-  .badge b {{ color: var(--text); }}
+  }
+  .badge b { color: var(--text); }
 
-  main {{ padding: 32px 40px; max-width: 1400px; margin: 0 auto; }}
+  main { padding: 32px 40px; max-width: 1400px; margin: 0 auto; }
 
   /* ── hero KPI row ─────────────────────────────────────────────────────────── */
-  .kpi-grid {{
+  .kpi-grid {
     display: grid;
     grid-template-columns: repeat(auto-fill, minmax(180px, 1fr));
     gap: 16px;
     margin-bottom: 40px;
-  }}
-  .kpi {{
+  }
+  .kpi {
     background: var(--panel);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 18px 20px;
     transition: border-color .2s;
-  }}
-  .kpi:hover {{ border-color: var(--accent); }}
-  .kpi .label {{ font-size: 11px; color: var(--muted); text-transform: uppercase;
-                 letter-spacing: .6px; margin-bottom: 6px; }}
-  .kpi .value {{ font-size: 26px; font-weight: 700; font-variant-numeric: tabular-nums; }}
-  .kpi .unit  {{ font-size: 12px; color: var(--muted); margin-top: 2px; }}
-  .kpi.blue  .value {{ color: var(--accent); }}
-  .kpi.green .value {{ color: var(--green); }}
-  .kpi.purple.value {{ color: var(--purple); }}
-  .kpi.orange .value {{ color: var(--orange); }}
+  }
+  .kpi:hover { border-color: var(--accent); }
+  .kpi .label { font-size: 11px; color: var(--muted); text-transform: uppercase;
+                 letter-spacing: .6px; margin-bottom: 6px; }
+  .kpi .value { font-size: 26px; font-weight: 700; font-variant-numeric: tabular-nums; }
+  .kpi .unit  { font-size: 12px; color: var(--muted); margin-top: 2px; }
+  .kpi.blue  .value { color: var(--accent); }
+  .kpi.green .value { color: var(--green); }
+  .kpi.purple.value { color: var(--purple); }
+  .kpi.orange .value { color: var(--orange); }
 
   /* ── sections ────────────────────────────────────────────────────────────── */
-  .section {{ margin-bottom: 48px; }}
-  .section-header {{
+  .section { margin-bottom: 48px; }
+  .section-header {
     display: flex; align-items: center; gap: 12px;
     margin-bottom: 20px;
     border-bottom: 1px solid var(--border);
     padding-bottom: 12px;
-  }}
-  .section-icon {{
+  }
+  .section-icon {
     width: 32px; height: 32px; border-radius: 8px;
     display: flex; align-items: center; justify-content: center;
     font-size: 16px;
-  }}
-  .section-icon.server  {{ background: rgba(88,166,255,.15); }}
-  .section-icon.cache   {{ background: rgba(63,185,80,.15);  }}
-  .section-icon.proxy   {{ background: rgba(188,140,255,.15);}}
-  .section-icon.ws      {{ background: rgba(210,153,34,.15); }}
-  .section h2 {{ font-size: 18px; font-weight: 600; }}
-  .section p.desc {{ font-size: 13px; color: var(--muted); margin-top: 2px; }}
+  }
+  .section-icon.server  { background: rgba(88,166,255,.15); }
+  .section-icon.cache   { background: rgba(63,185,80,.15);  }
+  .section-icon.proxy   { background: rgba(188,140,255,.15);}
+  .section-icon.ws      { background: rgba(210,153,34,.15); }
+  .section h2 { font-size: 18px; font-weight: 600; }
+  .section p.desc { font-size: 13px; color: var(--muted); margin-top: 2px; }
 
   /* ── chart cards ─────────────────────────────────────────────────────────── */
-  .chart-grid {{
+  .chart-grid {
     display: grid;
     gap: 16px;
-  }}
-  .chart-grid.cols-2 {{ grid-template-columns: 1fr 1fr; }}
-  .chart-grid.cols-3 {{ grid-template-columns: 1fr 1fr 1fr; }}
-  @media (max-width: 900px) {{
+  }
+  .chart-grid.cols-2 { grid-template-columns: 1fr 1fr; }
+  .chart-grid.cols-3 { grid-template-columns: 1fr 1fr 1fr; }
+  @media (max-width: 900px) {
     .chart-grid.cols-2,
-    .chart-grid.cols-3 {{ grid-template-columns: 1fr; }}
-  }}
-  .card {{
+    .chart-grid.cols-3 { grid-template-columns: 1fr; }
+  }
+  .card {
     background: var(--panel);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 20px 24px;
-  }}
-  .card h3 {{
+  }
+  .card h3 {
     font-size: 13px; font-weight: 600; color: var(--muted);
     text-transform: uppercase; letter-spacing: .5px; margin-bottom: 16px;
-  }}
-  .chart-wrap {{ position: relative; height: 220px; }}
-  .chart-wrap.tall {{ height: 280px; }}
+  }
+  .chart-wrap { position: relative; height: 220px; }
+  .chart-wrap.tall { height: 280px; }
+  .chart-wrap svg { display: block; width: 100%; height: 100%; }
+  .chart-wrap svg text { fill: var(--muted); font-size: 12px; }
+  .chart-wrap svg text.val { fill: var(--text); font-variant-numeric: tabular-nums; }
+  .chart-wrap svg .axis { stroke: var(--border); }
 
   /* ── stat table ──────────────────────────────────────────────────────────── */
-  .stat-table {{ width: 100%; border-collapse: collapse; margin-top: 4px; }}
-  .stat-table th, .stat-table td {{
+  .stat-table { width: 100%; border-collapse: collapse; margin-top: 4px; }
+  .stat-table th, .stat-table td {
     padding: 8px 12px; text-align: left; border-bottom: 1px solid var(--border);
     font-size: 13px;
-  }}
-  .stat-table th {{ color: var(--muted); font-weight: 500; font-size: 12px;
-                    text-transform: uppercase; letter-spacing: .4px; }}
-  .stat-table tr:last-child td {{ border-bottom: none; }}
-  .stat-table .num {{ text-align: right; font-variant-numeric: tabular-nums;
-                      font-weight: 600; color: var(--text); }}
-  .stat-table .hi  {{ color: var(--green); }}
-  .stat-table .lo  {{ color: var(--muted); }}
-
-  footer {{
+  }
+  .stat-table th { color: var(--muted); font-weight: 500; font-size: 12px;
+                    text-transform: uppercase; letter-spacing: .4px; }
+  .stat-table tr:last-child td { border-bottom: none; }
+  .stat-table .num { text-align: right; font-variant-numeric: tabular-nums;
+                      font-weight: 600; color: var(--text); }
+  .stat-table .hi  { color: var(--green); }
+  .stat-table .lo  { color: var(--muted); }
+
+  footer {
     border-top: 1px solid var(--border);
     padding: 20px 40px;
     color: var(--muted);
     font-size: 12px;
     text-align: center;
-  }}
-</style>
+  }
+"""
+
+
+# ── load results ─────────────────────────────────────────────────────────────
+sf, sf_mt = latest("server")
+cf, cf_mt = latest("cache")
+pf, pf_mt = latest("proxy")
+wf, wf_mt = latest("websocket")
+
+server  = index(load(sf))
+cache   = index(load(cf))
+proxy   = index(load(pf))
+ws      = index(load(wf))
+
+# Pick the latest timestamp for the title
+ts_mt  = max((mt for f, mt in ((sf, sf_mt), (cf, cf_mt), (pf, pf_mt), (wf, wf_mt)) if f), default=None)
+ts_str = datetime.fromtimestamp(ts_mt).strftime("%Y-%m-%d %H:%M") if ts_mt is not None else "unknown"
+
+# ── server metrics ────────────────────────────────────────────────────────────
+S = floats(server, {
+    "conn_rate":  ("server_connection_rate",   "connections_per_sec"),
+    "burst_rate": ("server_burst_connections", "connections_per_sec"),
+    "conn_lat":   ("server_connection_rate",   "avg_latency_ms"),
+    "tp64_msg":   (("server_single_client_throughput", 64),   "messages_per_sec"),
+    "tp64_mb":    (("server_single_client_throughput", 64),   "throughput_mb_sec"),
+    "tp1k_msg":   (("server_single_client_throughput", 1024), "messages_per_sec"),
+    "tp1k_mb":    (("server_single_client_throughput", 1024), "throughput_mb_sec"),
+    "conc_msg":   ("server_concurrent_clients", "messages_per_sec"),
+    "max_conn":   ("server_burst_connections",  "max_concurrent"),
+})
+
+# ── cache metrics ─────────────────────────────────────────────────────────────
+C = floats(cache, {
+    "set":   ("cache_set_throughput",    "ops_per_sec"),
+    "get":   ("cache_get_throughput",    "ops_per_sec"),
+    "mix":   ("cache_mixed_workload",    "ops_per_sec"),
+    "conc":  ("cache_concurrent_access", "ops_per_sec"),
+    "flush": ("cache_persistence",       "flush_time_ms"),
+    "load":  ("cache_persistence",       "load_time_ms"),
+})
+
+# ── proxy metrics ─────────────────────────────────────────────────────────────
+P = floats(proxy, {
+    "http1":    ("proxy_http_single_backend",    "requests_per_sec"),
+    "httplb":   ("proxy_http_load_balancing",    "requests_per_sec"),
+    "tcp":      ("proxy_tcp_throughput",         "messages_per_sec"),
+    "tcp_mb":   ("proxy_tcp_throughput",         "throughput_mb_sec"),
+    "conc":     ("proxy_concurrent_connections", "messages_per_sec"),
+    "overhead": ("proxy_overhead",               "overhead_percent"),
+    "name":     ("proxy_runtime_name_backend",   "messages_per_sec"),
+})
+
+# ── websocket metrics ─────────────────────────────────────────────────────────
+W = floats(ws, {
+    "hs":   ("ws_handshake_throughput", "ops_per_sec"),
+    "coex": ("ws_tcp_coexistence",      "ops_per_sec"),
+    "conc": ("ws_concurrent",           "ops_per_sec"),
+})
+
+
+def kilo(n):
+    return round(n / 1000, 1)
+
+
+# ── pre-formatted display values ──────────────────────────────────────────────
+sv_conn_rate_f = fmt(S["conn_rate"], 1)
+sv_burst_rate_f= fmt(S["burst_rate"], 1)
+sv_tp64_msg_f  = fmt(S["tp64_msg"], 1)
+sv_conc_msg_f  = fmt(S["conc_msg"], 1)
+sv_max_conn_i  = int(S["max_conn"])
+cv_get_f       = fmt(C["get"], 1)
+cv_set_f       = fmt(C["set"], 1)
+pv_http1_f     = fmt(P["http1"], 1)
+wv_hs_f        = fmt(W["hs"], 1)
+
+sv_conn_k = kilo(S["conn_rate"])
+sv_burst_k= kilo(S["burst_rate"])
+sv_tp64_k = kilo(S["tp64_msg"])
+sv_tp1k_k = kilo(S["tp1k_msg"])
+sv_conc_k = kilo(S["conc_msg"])
+cv_set_k  = kilo(C["set"])
+cv_get_k  = kilo(C["get"])
+cv_mix_k  = kilo(C["mix"])
+cv_conc_k = kilo(C["conc"])
+pv_tcp_k  = kilo(P["tcp"])
+pv_conc_k = kilo(P["conc"])
+pv_name_k = kilo(P["name"])
+
+cv_flush_row = (f"<tr><td>Flush (persist)</td><td class='num'>{int(C['flush'])} ms</td>"
+                f"<td class='num lo'>—</td></tr>") if C["flush"] else ""
+cv_load_row  = (f"<tr><td>Load (restore)</td><td class='num'>{int(C['load'])} ms</td>"
+                f"<td class='num lo'>—</td></tr>") if C["load"] else ""
+
+# ── chart data ────────────────────────────────────────────────────────────────
+chart_data = {
+    "sConn": {"labels": ["Sustained", "Burst (5K)"],
+              "values": [sv_conn_k, sv_burst_k],
+              "colors": ["#58a6ff", "#388bfd"],
+              "horizontal": True, "unit": "conn/sec (K)"},
+    "sTp":   {"labels": ["64 B msg", "1 KB msg"],
+              "values": [sv_tp64_k, sv_tp1k_k],
+              "colors": ["#58a6ff", "#388bfd"],
+              "horizontal": False, "unit": "K msg/sec"},
+    "sMb":   {"labels": ["64 B", "1 KB"],
+              "values": [round(S["tp64_mb"], 1), round(S["tp1k_mb"], 1)],
+              "colors": ["#58a6ff", "#388bfd"],
+              "horizontal": False, "unit": "MB/sec"},
+    "sConc": {"labels": ["100 clients × 500 msgs"],
+              "values": [sv_conc_k],
+              "colors": ["#3fb950"],
+              "horizontal": True, "unit": "K msg/sec aggregate"},
+    "cOps":  {"labels": ["SET", "GET", "Mixed 80/20", "20-client conc."],
+              "values": [cv_set_k, cv_get_k, cv_mix_k, cv_conc_k],
+              "colors": ["#3fb950", "#56d364", "#3fb950", "#26a641"],
+              "horizontal": False, "unit": "K ops/sec"},
+    "pHttp": {"labels": ["Single backend", "Load balancing"],
+              "values": [round(P["http1"]), round(P["httplb"])],
+              "colors": ["#bc8cff", "#a371f7"],
+              "horizontal": True, "unit": "req/sec"},
+    "pTcp":  {"labels": ["Single", "20-client conc.", "Named backend"],
+              "values": [pv_tcp_k, pv_conc_k, pv_name_k],
+              "colors": ["#bc8cff", "#a371f7", "#8957e5"],
+              "horizontal": True, "unit": "K msg/sec"},
+    "ws":    {"labels": ["Handshake", "WS+TCP coexist", "20-client conc."],
+              "values": [round(W["hs"]), round(W["coex"]), round(W["conc"])],
+              "colors": ["#d29922", "#e3b341", "#bb8009"],
+              "horizontal": False, "unit": "ops/sec"},
+}
+charts = {k: bar_svg(**c) for k, c in chart_data.items()}
+
+
+# ── report sections ───────────────────────────────────────────────────────────
+parts = []
+
+parts.append(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>Socketley Benchmark Results</title>
+<style>
+{_CSS}</style>
 </head>
 <body>
 
@@ -299,56 +422,62 @@ HTML = f"""<!DOCTYPE html>
 
 <main>
 
-<!-- ── KPI hero ──────────────────────────────────────────────────────────── -->
+""")
+
+# ── KPI hero ──────────────────────────────────────────────────────────────────
+parts.append(f"""<!-- ── KPI hero ──────────────────────────────────────────────────────────── -->
 <div class="kpi-grid">
   <div class="kpi blue">
     <div class="label">Server conn/sec</div>
-    <div class="value">{fmt(sv_conn_rate, 1)}</div>
+    <div class="value">{sv_conn_rate_f}</div>
     <div class="unit">connections per second</div>
   </div>
   <div class="kpi blue">
     <div class="label">Burst connections</div>
-    <div class="value">{fmt(sv_burst_rate, 1)}</div>
+    <div class="value">{sv_burst_rate_f}</div>
     <div class="unit">5 000-conn burst</div>
   </div>
   <div class="kpi blue">
     <div class="label">Single-client throughput</div>
-    <div class="value">{fmt(sv_tp64_msg, 1)}</div>
+    <div class="value">{sv_tp64_msg_f}</div>
     <div class="unit">msg/sec @ 64 B</div>
   </div>
   <div class="kpi blue">
     <div class="label">100-client aggregate</div>
-    <div class="value">{fmt(sv_conc_msg, 1)}</div>
+    <div class="value">{sv_conc_msg_f}</div>
     <div class="unit">msg/sec concurrent</div>
   </div>
   <div class="kpi green">
     <div class="label">Cache GET</div>
-    <div class="value">{fmt(cv_get, 1)}</div>
+    <div class="value">{cv_get_f}</div>
     <div class="unit">ops/sec</div>
   </div>
   <div class="kpi green">
     <div class="label">Cache SET</div>
-    <div class="value">{fmt(cv_set, 1)}</div>
+    <div class="value">{cv_set_f}</div>
     <div class="unit">ops/sec</div>
   </div>
   <div class="kpi purple">
     <div class="label">HTTP proxy</div>
-    <div class="value">{fmt(pv_http1, 1)}</div>
+    <div class="value">{pv_http1_f}</div>
     <div class="unit">req/sec</div>
   </div>
   <div class="kpi purple">
     <div class="label">Proxy overhead</div>
-    <div class="value">{pv_overhead:.1f}%</div>
+    <div class="value">{P['overhead']:.1f}%</div>
     <div class="unit">vs direct connection</div>
   </div>
   <div class="kpi orange">
     <div class="label">WS handshakes</div>
-    <div class="value">{fmt(wv_hs, 1)}</div>
+    <div class="value">{wv_hs_f}</div>
     <div class="unit">handshakes/sec</div>
   </div>
 </div>
 
-<!-- ═══════════════════════════════════════════════════════════════════════ -->
+""")
+
+# ── server section ────────────────────────────────────────────────────────────
+parts.append(f"""<!-- ═══════════════════════════════════════════════════════════════════════ -->
 <!-- SERVER                                                                  -->
 <!-- ═══════════════════════════════════════════════════════════════════════ -->
 <div class="section">
@@ -364,19 +493,19 @@ HTML = f"""<!DOCTYPE html>
     <div class="card">
       <h3>Connection Rate (K conn/sec)</h3>
       <div class="chart-wrap">
-        <canvas id="sConnChart"></canvas>
+        {charts['sConn']}
       </div>
     </div>
     <div class="card">
       <h3>Single-Client Throughput (K msg/sec)</h3>
       <div class="chart-wrap">
-        <canvas id="sTpChart"></canvas>
+        {charts['sTp']}
       </div>
     </div>
     <div class="card">
       <h3>Throughput (MB/sec)</h3>
       <div class="chart-wrap">
-        <canvas id="sMbChart"></canvas>
+        {charts['sMb']}
       </div>
     </div>
   </div>
@@ -385,7 +514,7 @@ HTML = f"""<!DOCTYPE html>
     <div class="card">
       <h3>Aggregate — 100 clients × 500 msgs (K msg/sec)</h3>
       <div class="chart-wrap">
-        <canvas id="sConcChart"></canvas>
+        {charts['sConc']}
       </div>
     </div>
     <div class="card" style="display:flex;flex-direction:column;justify-content:center;">
@@ -393,21 +522,24 @@ HTML = f"""<!DOCTYPE html>
       <table class="stat-table">
         <thead><tr><th>Test</th><th class="num">Value</th><th class="num">Unit</th></tr></thead>
         <tbody>
-          <tr><td>Conn rate (sustained)</td><td class="num hi">{sv_conn_rate:,.0f}</td><td class="num lo">conn/sec</td></tr>
-          <tr><td>Conn rate (burst 5K)</td><td class="num hi">{sv_burst_rate:,.0f}</td><td class="num lo">conn/sec</td></tr>
-          <tr><td>Avg connect latency</td><td class="num">{sv_conn_lat:.3f}</td><td class="num lo">ms</td></tr>
-          <tr><td>Max concurrent</td><td class="num hi">{int(sv_max_conn):,}</td><td class="num lo">connections</td></tr>
-          <tr><td>64 B throughput</td><td class="num hi">{sv_tp64_msg:,.0f}</td><td class="num lo">msg/sec</td></tr>
-          <tr><td>1 KB throughput</td><td class="num hi">{sv_tp1k_msg:,.0f}</td><td class="num lo">msg/sec</td></tr>
-          <tr><td>1 KB bandwidth</td><td class="num hi">{sv_tp1k_mb:.1f}</td><td class="num lo">MB/sec</td></tr>
-          <tr><td>100-client aggregate</td><td class="num hi">{sv_conc_msg:,.0f}</td><td class="num lo">msg/sec</td></tr>
+          <tr><td>Conn rate (sustained)</td><td class="num hi">{S['conn_rate']:,.0f}</td><td class="num lo">conn/sec</td></tr>
+          <tr><td>Conn rate (burst 5K)</td><td class="num hi">{S['burst_rate']:,.0f}</td><td class="num lo">conn/sec</td></tr>
+          <tr><td>Avg connect latency</td><td class="num">{S['conn_lat']:.3f}</td><td class="num lo">ms</td></tr>
+          <tr><td>Max concurrent</td><td class="num hi">{sv_max_conn_i:,}</td><td class="num lo">connections</td></tr>
+          <tr><td>64 B throughput</td><td class="num hi">{S['tp64_msg']:,.0f}</td><td class="num lo">msg/sec</td></tr>
+          <tr><td>1 KB throughput</td><td class="num hi">{S['tp1k_msg']:,.0f}</td><td class="num lo">msg/sec</td></tr>
+          <tr><td>1 KB bandwidth</td><td class="num hi">{S['tp1k_mb']:.1f}</td><td class="num lo">MB/sec</td></tr>
+          <tr><td>100-client aggregate</td><td class="num hi">{S['conc_msg']:,.0f}</td><td class="num lo">msg/sec</td></tr>
         </tbody>
       </table>
     </div>
   </div>
 </div>
 
-<!-- ═══════════════════════════════════════════════════════════════════════ -->
+""")
+
+# ── cache section ─────────────────────────────────────────────────────────────
+parts.append(f"""<!-- ═══════════════════════════════════════════════════════════════════════ -->
 <!-- CACHE                                                                   -->
 <!-- ═══════════════════════════════════════════════════════════════════════ -->
 <div class="section">
@@ -423,7 +555,7 @@ HTML = f"""<!DOCTYPE html>
     <div class="card">
       <h3>Operation Throughput (K ops/sec)</h3>
       <div class="chart-wrap">
-        <canvas id="cOpsChart"></canvas>
+        {charts['cOps']}
       </div>
     </div>
     <div class="card" style="display:flex;flex-direction:column;justify-content:center;">
@@ -431,19 +563,22 @@ HTML = f"""<!DOCTYPE html>
       <table class="stat-table">
         <thead><tr><th>Test</th><th class="num">ops/sec</th><th class="num">ops/sec (K)</th></tr></thead>
         <tbody>
-          <tr><td>SET throughput</td><td class="num hi">{cv_set:,.0f}</td><td class="num lo">{cv_set/1000:.1f}K</td></tr>
-          <tr><td>GET throughput</td><td class="num hi">{cv_get:,.0f}</td><td class="num lo">{cv_get/1000:.1f}K</td></tr>
-          <tr><td>Mixed 80/20 GET/SET</td><td class="num hi">{cv_mix:,.0f}</td><td class="num lo">{cv_mix/1000:.1f}K</td></tr>
-          <tr><td>20-client concurrent</td><td class="num hi">{cv_conc:,.0f}</td><td class="num lo">{cv_conc/1000:.1f}K</td></tr>
-          {"<tr><td>Flush (persist)</td><td class='num'>" + str(int(cv_flush)) + " ms</td><td class='num lo'>—</td></tr>" if cv_flush else ""}
-          {"<tr><td>Load (restore)</td><td class='num'>" + str(int(cv_load)) + " ms</td><td class='num lo'>—</td></tr>" if cv_load else ""}
+          <tr><td>SET throughput</td><td class="num hi">{C['set']:,.0f}</td><td class="num lo">{cv_set_k:.1f}K</td></tr>
+          <tr><td>GET throughput</td><td class="num hi">{C['get']:,.0f}</td><td class="num lo">{cv_get_k:.1f}K</td></tr>
+          <tr><td>Mixed 80/20 GET/SET</td><td class="num hi">{C['mix']:,.0f}</td><td class="num lo">{cv_mix_k:.1f}K</td></tr>
+          <tr><td>20-client concurrent</td><td class="num hi">{C['conc']:,.0f}</td><td class="num lo">{cv_conc_k:.1f}K</td></tr>
+          {cv_flush_row}
+          {cv_load_row}
         </tbody>
       </table>
     </div>
   </div>
 </div>
 
-<!-- ═══════════════════════════════════════════════════════════════════════ -->
+""")
+
+# ── proxy section ─────────────────────────────────────────────────────────────
+parts.append(f"""<!-- ═══════════════════════════════════════════════════════════════════════ -->
 <!-- PROXY                                                                   -->
 <!-- ═══════════════════════════════════════════════════════════════════════ -->
 <div class="section">
@@ -459,13 +594,13 @@ HTML = f"""<!DOCTYPE html>
     <div class="card">
       <h3>HTTP Proxy Throughput (req/sec)</h3>
       <div class="chart-wrap">
-        <canvas id="pHttpChart"></canvas>
+        {charts['pHttp']}
       </div>
     </div>
     <div class="card">
       <h3>TCP Forwarding (K msg/sec)</h3>
       <div class="chart-wrap">
-        <canvas id="pTcpChart"></canvas>
+        {charts['pTcp']}
       </div>
     </div>
     <div class="card" style="display:flex;flex-direction:column;justify-content:center;">
@@ -473,20 +608,23 @@ HTML = f"""<!DOCTYPE html>
       <table class="stat-table">
         <thead><tr><th>Test</th><th class="num">Value</th><th class="num">Unit</th></tr></thead>
         <tbody>
-          <tr><td>HTTP single backend</td><td class="num hi">{pv_http1:,.0f}</td><td class="num lo">req/sec</td></tr>
-          <tr><td>HTTP load balancing</td><td class="num hi">{pv_httplb:,.0f}</td><td class="num lo">req/sec</td></tr>
-          <tr><td>TCP throughput</td><td class="num hi">{pv_tcp:,.0f}</td><td class="num lo">msg/sec</td></tr>
-          <tr><td>TCP bandwidth</td><td class="num hi">{pv_tcp_mb:.1f}</td><td class="num lo">MB/sec</td></tr>
-          <tr><td>20-client concurrent</td><td class="num hi">{pv_conc:,.0f}</td><td class="num lo">msg/sec</td></tr>
-          <tr><td>Named backend</td><td class="num hi">{pv_name:,.0f}</td><td class="num lo">msg/sec</td></tr>
-          <tr><td>Proxy overhead</td><td class="num">{pv_overhead:.1f}%</td><td class="num lo">vs direct</td></tr>
+          <tr><td>HTTP single backend</td><td class="num hi">{P['http1']:,.0f}</td><td class="num lo">req/sec</td></tr>
+          <tr><td>HTTP load balancing</td><td class="num hi">{P['httplb']:,.0f}</td><td class="num lo">req/sec</td></tr>
+          <tr><td>TCP throughput</td><td class="num hi">{P['tcp']:,.0f}</td><td class="num lo">msg/sec</td></tr>
+          <tr><td>TCP bandwidth</td><td class="num hi">{P['tcp_mb']:.1f}</td><td class="num lo">MB/sec</td></tr>
+          <tr><td>20-client concurrent</td><td class="num hi">{P['conc']:,.0f}</td><td class="num lo">msg/sec</td></tr>
+          <tr><td>Named backend</td><td class="num hi">{P['name']:,.0f}</td><td class="num lo">msg/sec</td></tr>
+          <tr><td>Proxy overhead</td><td class="num">{P['overhead']:.1f}%</td><td class="num lo">vs direct</td></tr>
         </tbody>
       </table>
     </div>
   </div>
 </div>
 
-<!-- ═══════════════════════════════════════════════════════════════════════ -->
+""")
+
+# ── websocket section ─────────────────────────────────────────────────────────
+parts.append(f"""<!-- ═══════════════════════════════════════════════════════════════════════ -->
 <!-- WEBSOCKET                                                               -->
 <!-- ═══════════════════════════════════════════════════════════════════════ -->
 <div class="section">
@@ -502,7 +640,7 @@ HTML = f"""<!DOCTYPE html>
     <div class="card">
       <h3>Handshake Throughput (ops/sec)</h3>
       <div class="chart-wrap">
-        <canvas id="wsChart"></canvas>
+        {charts['ws']}
       </div>
     </div>
     <div class="card" style="display:flex;flex-direction:column;justify-content:center;">
@@ -510,153 +648,34 @@ HTML = f"""<!DOCTYPE html>
       <table class="stat-table">
         <thead><tr><th>Test</th><th class="num">ops/sec</th></tr></thead>
         <tbody>
-          <tr><td>Handshake throughput</td><td class="num hi">{wv_hs:,.0f}</td></tr>
-          <tr><td>WS + TCP coexistence</td><td class="num hi">{wv_coex:,.0f}</td></tr>
-          <tr><td>20-client concurrent</td><td class="num hi">{wv_conc:,.0f}</td></tr>
+          <tr><td>Handshake throughput</td><td class="num hi">{W['hs']:,.0f}</td></tr>
+          <tr><td>WS + TCP coexistence</td><td class="num hi">{W['coex']:,.0f}</td></tr>
+          <tr><td>20-client concurrent</td><td class="num hi">{W['conc']:,.0f}</td></tr>
         </tbody>
       </table>
     </div>
   </div>
 </div>
 
-</main>
+""")
+
+# ── footer ────────────────────────────────────────────────────────────────────
+parts.append(f"""</main>
 
 <footer>
   Socketley Benchmark · {ts_str} · Intel Core Ultra 5 125H · 4c/3.8 GiB VM · Kernel 6.8.0-100-generic
 </footer>
 
-<script>
-Chart.defaults.color = '#8b949e';
-Chart.defaults.borderColor = '#30363d';
-Chart.defaults.font.family = '-apple-system, BlinkMacSystemFont, "Segoe UI", monospace';
-Chart.defaults.font.size = 12;
-
-function hbar(id, labels, data, colors, xLabel) {{
-  const ctx = document.getElementById(id).getContext('2d');
-  new Chart(ctx, {{
-    type: 'bar',
-    data: {{
-      labels: labels,
-      datasets: [{{ data: data, backgroundColor: colors, borderRadius: 5, borderSkipped: false }}]
-    }},
-    options: {{
-      indexAxis: 'y',
-      responsive: true,
-      maintainAspectRatio: false,
-      plugins: {{
-        legend: {{ display: false }},
-        tooltip: {{
-          callbacks: {{
-            label: ctx => ' ' + ctx.parsed.x.toLocaleString(undefined, {{maximumFractionDigits:1}}) + (xLabel ? ' ' + xLabel : '')
-          }}
-        }}
-      }},
-      scales: {{
-        x: {{
-          grid: {{ color: '#21262d' }},
-          ticks: {{ callback: v => v >= 1000 ? (v/1000).toFixed(v%1000===0?0:1)+'K' : v }}
-        }},
-        y: {{ grid: {{ display: false }} }}
-      }}
-    }}
-  }});
-}}
-
-function vbar(id, labels, data, colors, yLabel) {{
-  const ctx = document.getElementById(id).getContext('2d');
-  new Chart(ctx, {{
-    type: 'bar',
-    data: {{
-      labels: labels,
-      datasets: [{{ data: data, backgroundColor: colors, borderRadius: 5, borderSkipped: false }}]
-    }},
-    options: {{
-      responsive: true,
-      maintainAspectRatio: false,
-      plugins: {{
-        legend: {{ display: false }},
-        tooltip: {{
-          callbacks: {{
-            label: ctx => ' ' + ctx.parsed.y.toLocaleString(undefined, {{maximumFractionDigits:1}}) + (yLabel ? ' ' + yLabel : '')
-          }}
-        }}
-      }},
-      scales: {{
-        y: {{
-          grid: {{ color: '#21262d' }},
-          ticks: {{ callback: v => v >= 1000 ? (v/1000).toFixed(v%1000===0?0:1)+'K' : v }}
-        }},
-        x: {{ grid: {{ display: false }} }}
-      }}
-    }}
-  }});
-}}
-
-// ── Server ────────────────────────────────────────────────────────────────
-hbar('sConnChart',
-  ['Sustained', 'Burst (5K)'],
-  [{kilo(sv_conn_rate)}, {kilo(sv_burst_rate)}],
-  ['#58a6ff', '#388bfd'],
-  'conn/sec (K)'
-);
-
-vbar('sTpChart',
-  ['64 B msg', '1 KB msg'],
-  [{kilo(sv_tp64_msg)}, {kilo(sv_tp1k_msg)}],
-  ['#58a6ff', '#388bfd'],
-  'K msg/sec'
-);
-
-vbar('sMbChart',
-  ['64 B', '1 KB'],
-  [{sv_tp64_mb:.1f}, {sv_tp1k_mb:.1f}],
-  ['#58a6ff', '#388bfd'],
-  'MB/sec'
-);
-
-hbar('sConcChart',
-  ['100 clients × 500 msgs'],
-  [{kilo(sv_conc_msg):.1f}],
-  ['#3fb950'],
-  'K msg/sec aggregate'
-);
-
-// ── Cache ─────────────────────────────────────────────────────────────────
-vbar('cOpsChart',
-  ['SET', 'GET', 'Mixed 80/20', '20-client conc.'],
-  [{kilo(cv_set):.1f}, {kilo(cv_get):.1f}, {kilo(cv_mix):.1f}, {kilo(cv_conc):.1f}],
-  ['#3fb950', '#56d364', '#3fb950', '#26a641'],
-  'K ops/sec'
-);
-
-// ── Proxy ─────────────────────────────────────────────────────────────────
-hbar('pHttpChart',
-  ['Single backend', 'Load balancing'],
-  [{pv_http1:.0f}, {pv_httplb:.0f}],
-  ['#bc8cff', '#a371f7'],
-  'req/sec'
-);
-
-hbar('pTcpChart',
-  ['Single', '20-client conc.', 'Named backend'],
-  [{kilo(pv_tcp):.1f}, {kilo(pv_conc):.1f}, {kilo(pv_name):.1f}],
-  ['#bc8cff', '#a371f7', '#8957e5'],
-  'K msg/sec'
-);
-
-// ── WebSocket ─────────────────────────────────────────────────────────────
-vbar('wsChart',
-  ['Handshake', 'WS+TCP coexist', '20-client conc.'],
-  [{wv_hs:.0f}, {wv_coex:.0f}, {wv_conc:.0f}],
-  ['#d29922', '#e3b341', '#bb8009'],
-  'ops/sec'
-);
-
-</script>
 </body>
 </html>
-"""
+""")
 
 out = RESULTS_DIR / f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-out.write_text(HTML)
+out_gz = out.with_name(out.name + ".gz")
+with out.open("wb", buffering=1 << 16) as f, gzip.open(out_gz, "wb", compresslevel=6) as gz:
+    for p in parts:
+        b = p.encode("utf-8")
+        f.write(b)
+        gz.write(b)
 print(f"Report written to: {out}")
+print(f"Compressed copy:   {out_gz}")